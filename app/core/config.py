@@ -1,31 +1,36 @@
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
 
 class Settings(BaseSettings):
     # Database Configuration
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
     
     # JWT Configuration
     JWT_SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing Configuration
+    BCRYPT_ROUNDS: int = 10
+    
     # Application Configuration
     DEBUG: bool = False
+    AUTO_CREATE_TABLES: bool = False
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
     
     # App Metadata
     PROJECT_NAME: str = "FastAPI Todo App"
     VERSION: str = "1.0.0"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
-    @property
+    @cached_property
     def origins_list(self) -> List[str]:
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
 
 # Global setting instance
 settings = Settings()
\ No newline at end of file
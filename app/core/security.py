@@ -1,7 +1,13 @@
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from types import SimpleNamespace
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from jwt import InvalidTokenError
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -9,12 +15,29 @@ from .config import settings
 from ..database import get_db
 from ..models.user import User
 
-# Password hashing configuration
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT token scheme
 security = HTTPBearer()
 
+# Token settings, resolved once instead of on every encode/decode
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# Verified token payloads keyed by token digest, evicted in LRU order or once expired
+_TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+
+# Recent successful password checks, so repeated logins skip the bcrypt work
+_VERIFY_CACHE_MAX_SIZE = 512
+_VERIFY_CACHE_TTL_SECONDS = 60
+_verify_cache: OrderedDict[bytes, float] = OrderedDict()
+
+# Authenticated users by id, kept as plain field snapshots (password hash excluded)
+_USER_CACHE_TTL_SECONDS = 30
+_CACHED_USER_FIELDS = ("id", "full_name", "email", "is_active", "created_at", "updated_at")
+_user_cache: dict[int, tuple[dict, float]] = {}
+
 def hash_password(password: str) -> str:
     """
     Hash a plain text password using bcrypt.
@@ -25,7 +48,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string safe for database storage
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -38,32 +62,111 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if passwords match, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # Keyed on the password and the stored salt, so a password change invalidates it
+    key = hmac.new(
+        _JWT_KEY,
+        plain_password.encode("utf-8") + hashed_password[:29].encode("utf-8"),
+        hashlib.blake2b
+    ).digest()
+    
+    cached_at = _verify_cache.get(key)
+    if cached_at is not None:
+        if time.time() - cached_at < _VERIFY_CACHE_TTL_SECONDS:
+            _verify_cache.move_to_end(key)
+            return True
+        del _verify_cache[key]
+    
+    if not bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8")):
+        # Failures are never cached, so the cache can't be used as a guessing oracle
+        return False
+    
+    _verify_cache[key] = time.time()
+    if len(_verify_cache) > _VERIFY_CACHE_MAX_SIZE:
+        _verify_cache.popitem(last=False)
+    
+    return True
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     
     to_encode = data.copy()
     
-    # Set expiration time
+    # Set expiration time as a unix timestamp
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + _ACCESS_TOKEN_EXPIRE_SECONDS
     
     # Add expiration to token payload
-    to_encode.update({"exp": expire})
+    to_encode["exp"] = expire
     
     # Create and return JWT token
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
+    """
+    Decode and verify a JWT token, reusing earlier results for the same token.
+    
+    Args:
+        token: Encoded JWT from the Authorization header
+        
+    Returns:
+        Token payload if valid, None otherwise
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    # Serve from cache until the token's own expiry
+    cached = _token_cache.get(key)
+    if cached is not None:
+        payload, exp = cached
+        if exp > time.time():
+            _token_cache.move_to_end(key)
+            return payload
+        del _token_cache[key]
     
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    except InvalidTokenError:
         return None
+    
+    # Only tokens with an expiry can be cached safely
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache[key] = (payload, exp)
+        if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return payload
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    
+    # Verify the token
+    payload = verify_token(credentials.credentials)
+    if payload is None:
+        raise _credentials_exception()
+    
+    # Extract user information from token
+    user_id: int = payload.get("user_id")
+    if user_id is None:
+        raise _credentials_exception()
+    
+    return user_id
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Drop a user from the authentication cache after their row changes.
+    
+    Args:
+        user_id: ID of the user whose profile or password was updated
+    """
+    _user_cache.pop(user_id, None)
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -73,6 +176,9 @@ async def get_current_user(
     Get current authenticated user from JWT token.
     This is a FastAPI dependency that can be used in route functions.
     
+    Recently loaded users are served from a short-lived cache as read-only
+    snapshots. Routes that modify the user must use get_current_db_user.
+    
     Args:
         credentials: HTTP Bearer token from request header
         db: Database session
@@ -83,25 +189,50 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
+    user_id = _get_token_user_id(credentials)
+    
+    # Serve a snapshot of recently loaded users without touching the database
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        fields, cached_at = cached
+        if time.time() - cached_at < _USER_CACHE_TTL_SECONDS:
+            return SimpleNamespace(**fields)
+    
+    # Get user from database
+    user = db.get(User, user_id)
+    if user is None:
+        raise _credentials_exception()
+    
+    _user_cache[user_id] = (
+        {field: getattr(user, field) for field in _CACHED_USER_FIELDS},
+        time.time()
     )
     
-    # Verify the token
-    payload = verify_token(credentials.credentials)
-    if payload is None:
-        raise credentials_exception
+    return user
+
+async def get_current_db_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get current authenticated user as a session-bound database object.
+    Use this instead of get_current_user in routes that modify the user.
     
-    # Extract user information from token
-    user_id: int = payload.get("user_id")
-    if user_id is None:
-        raise credentials_exception
+    Args:
+        credentials: HTTP Bearer token from request header
+        db: Database session
+        
+    Returns:
+        User object of authenticated user
+        
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = _get_token_user_id(credentials)
     
     # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
-    return user
\ No newline at end of file
+    return user
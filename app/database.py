@@ -6,7 +6,14 @@ from .core.config import settings
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG  # Shows SQL queries in console when DEBUG=True
+    echo=settings.DEBUG,  # Shows SQL queries in console when DEBUG=True
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_recycle=1800,  # Replace connections older than 30 minutes
+    pool_pre_ping=True,  # Detect dropped connections before handing them out
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection first
+    query_cache_size=1200  # Compiled SQL cache entries, reused across requests
 )
 
 # Create SessionLocal class for database sessions
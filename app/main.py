@@ -1,19 +1,22 @@
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from .core.config import settings
 from .database import engine
 from .models import user, todo
 from .routes import auth, todos
 
-# Create database tables
-user.Base.metadata.create_all(bind=engine)
-todo.Base.metadata.create_all(bind=engine)
+# Create database tables (production databases are expected to be migrated separately)
+if settings.DEBUG or settings.AUTO_CREATE_TABLES:
+    user.Base.metadata.create_all(bind=engine)
+    todo.Base.metadata.create_all(bind=engine)
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
+    default_response_class=ORJSONResponse,
     description="""
     A secure Todo List API built with FastAPI.
     
@@ -62,34 +65,44 @@ app.add_middleware(
 app.include_router(auth.router)
 app.include_router(todos.router)
 
+# Static response bodies, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to FastAPI Todo List API",
+    "version": settings.VERSION,
+    "status": "active",
+    "documentation": "/docs",
+    "redoc": "/redoc",
+    "endpoints": {
+        "auth": {
+            "register": "/auth/register",
+            "login": "/auth/login",
+            "profile": "/auth/me"
+        },
+        "todos": {
+            "list": "/todos",
+            "create": "/todos",
+            "get": "/todos/{id}",
+            "update": "/todos/{id}",
+            "delete": "/todos/{id}",
+            "stats": "/todos/stats/count"
+        }
+    }
+})
+
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "2025-01-10T00:00:00Z",
+    "version": settings.VERSION,
+    "database": "connected"
+})
+
 # Root endpoint
 @app.get("/", tags=["Root"])
 def read_root():
     """
     Root endpoint - API health check and information.
     """
-    return {
-        "message": "Welcome to FastAPI Todo List API",
-        "version": settings.VERSION,
-        "status": "active",
-        "documentation": "/docs",
-        "redoc": "/redoc",
-        "endpoints": {
-            "auth": {
-                "register": "/auth/register",
-                "login": "/auth/login",
-                "profile": "/auth/me"
-            },
-            "todos": {
-                "list": "/todos",
-                "create": "/todos",
-                "get": "/todos/{id}",
-                "update": "/todos/{id}",
-                "delete": "/todos/{id}",
-                "stats": "/todos/stats/count"
-            }
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 # Health check endpoint
 @app.get("/health", tags=["Root"])
@@ -97,17 +110,12 @@ def health_check():
     """
     Health check endpoint for monitoring and load balancers.
     """
-    return {
-        "status": "healthy",
-        "timestamp": "2025-01-10T00:00:00Z",
-        "version": settings.VERSION,
-        "database": "connected"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Global exception handler
 @app.exception_handler(404)
 def custom_404_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "detail": "Endpoint not found",
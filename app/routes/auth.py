@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from datetime import timedelta
+import string
 from ..database import get_db
 from ..models.user import User
 from ..schemas.user import UserCreate, UserLogin, UserUpdate, UserResponse, Token
@@ -8,10 +10,11 @@ from ..core.security import (
     hash_password,
     verify_password,
     create_access_token,
-    get_current_user
+    get_current_user,
+    get_current_db_user,
+    invalidate_cached_user
 )
 from ..core.config import settings
-import re
 
 # Create router instance
 router = APIRouter(
@@ -29,17 +32,9 @@ def register_user(
     
     - **full_name**: User's full name (required)
     - **email**: Valid email address (required, must be unique)
-    - **password**: Password with minimum 6 characters (required)
+    - **password**: Password with minimum 8 characters, including an uppercase letter and a number (required)
     """
     
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
     # Hash the password
     hashed_password = hash_password(user_data.password)
     
@@ -50,9 +45,16 @@ def register_user(
         password=hashed_password
     )
     
-    # Save to database
+    # Save to database (the unique constraint on email rejects duplicates)
     db.add(new_user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     db.refresh(new_user)
     
     return new_user
@@ -110,7 +112,7 @@ def login_user(
 @router.put("/me", response_model=UserResponse)
 def update_user_profile(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -132,7 +134,7 @@ def update_user_profile(
             )
     
     # Update only provided fields
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
     
     for field, value in update_data.items():
         setattr(current_user, field, value)
@@ -140,13 +142,14 @@ def update_user_profile(
     # Save changes
     db.commit()
     db.refresh(current_user)
+    invalidate_cached_user(current_user.id)
     
     return current_user
 
 @router.put("/me/password", response_model=dict)
 def change_password(
     password_data: dict,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db)
 ):
     """
@@ -179,13 +182,16 @@ def change_password(
             detail="Password must be at least 8 characters long"
         )
     
-    if not re.search(r'[A-Z]', new_password):
+    # Collect the distinct characters once, then test both classes with C-level set checks
+    chars = set(new_password)
+    
+    if chars.isdisjoint(string.ascii_uppercase):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password must contain at least one uppercase letter"
         )
     
-    if not re.search(r'[0-9]', new_password):
+    if chars.isdisjoint(string.digits):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password must contain at least one number"
@@ -196,6 +202,7 @@ def change_password(
     
     # Save changes
     db.commit()
+    invalidate_cached_user(current_user.id)
     
     return {"message": "Password updated successfully"}
 
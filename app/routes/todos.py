@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import func, case, select, update, delete
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
@@ -19,6 +20,16 @@ router = APIRouter(
     tags=["Todos"]
 )
 
+# Columns needed to build a TodoResponse without loading ORM objects
+_TODO_COLUMNS = (
+    Todo.id,
+    Todo.user_id,
+    Todo.task,
+    Todo.completed,
+    Todo.created_at,
+    Todo.updated_at
+)
+
 @router.get("/", response_model=TodoListResponse)
 def get_todos(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
@@ -37,21 +48,28 @@ def get_todos(
     Returns paginated list with total count.
     """
     
-    # Build query for current user's todos
-    query = db.query(Todo).filter(Todo.user_id == current_user.id)
+    # Build a Core select over the response columns, skipping ORM object loading
+    stmt = select(*_TODO_COLUMNS).where(Todo.user_id == current_user.id)
     
     # Apply completed filter if provided
     if completed is not None:
-        query = query.filter(Todo.completed == completed)
+        stmt = stmt.where(Todo.completed == completed)
     
-    # Get total count
-    total = query.count()
+    # Apply pagination, with COUNT(*) OVER () carrying the total on every row
+    rows = db.execute(
+        stmt.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+    ).all()
     
-    # Apply pagination and get todos
-    todos = query.offset(skip).limit(limit).all()
+    if rows:
+        total = rows[0].total
+    elif skip == 0:
+        total = 0
+    else:
+        # Page is past the end, so no row carries the total
+        total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
     
     return TodoListResponse(
-        todos=todos,
+        todos=rows,
         total=total
     )
 
@@ -95,17 +113,44 @@ def get_todo(
     """
     
     # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.user_id == current_user.id
-    ).first()
+    todo = db.get(Todo, todo_id)
+    
+    if todo is None or todo.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo not found"
+        )
+    
+    return todo
+
+def _update_todo(todo_id: int, update_data: dict, user_id: int, db: Session):
+    """
+    Apply an update to one of the user's todos and return the updated row.
     
-    if not todo:
+    Ownership check, update and read-back happen in a single
+    UPDATE ... RETURNING statement.
+    """
+    if update_data:
+        stmt = (
+            update(Todo)
+            .where(Todo.id == todo_id, Todo.user_id == user_id)
+            .values(**update_data)
+            .returning(*_TODO_COLUMNS)
+        )
+    else:
+        stmt = select(*_TODO_COLUMNS).where(Todo.id == todo_id, Todo.user_id == user_id)
+    
+    todo = db.execute(stmt).one_or_none()
+    
+    if todo is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
     
+    # Save changes
+    db.commit()
+    
     return todo
 
 @router.put("/{todo_id}", response_model=TodoResponse)
@@ -124,29 +169,10 @@ def update_todo(
     Users can only update their own todos.
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.user_id == current_user.id
-    ).first()
-    
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found"
-        )
-    
     # Update fields that were provided
-    update_data = todo_update.dict(exclude_unset=True)
+    update_data = todo_update.model_dump(exclude_unset=True)
     
-    for field, value in update_data.items():
-        setattr(todo, field, value)
-    
-    # Save changes
-    db.commit()
-    db.refresh(todo)
-    
-    return todo
+    return _update_todo(todo_id, update_data, current_user.id, db)
 
 @router.patch("/{todo_id}", response_model=TodoResponse)
 def patch_todo(
@@ -164,20 +190,8 @@ def patch_todo(
     Only updates fields that are provided. Users can only update their own todos.
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.user_id == current_user.id
-    ).first()
-    
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found"
-        )
-    
     # Update only provided fields
-    patch_data = todo_patch.dict(exclude_unset=True)
+    patch_data = todo_patch.model_dump(exclude_unset=True)
     
     if not patch_data:
         raise HTTPException(
@@ -185,14 +199,7 @@ def patch_todo(
             detail="No fields provided for update"
         )
     
-    for field, value in patch_data.items():
-        setattr(todo, field, value)
-    
-    # Save changes
-    db.commit()
-    db.refresh(todo)
-    
-    return todo
+    return _update_todo(todo_id, patch_data, current_user.id, db)
 
 
 @router.delete("/{todo_id}", response_model=TodoDeleteResponse)
@@ -207,24 +214,24 @@ def delete_todo(
     Users can only delete their own todos.
     """
     
-    # Find todo
-    todo = db.query(Todo).filter(
-        Todo.id == todo_id,
-        Todo.user_id == current_user.id
-    ).first()
+    # Delete todo, returning its task so ownership check and delete share one round trip
+    stmt = (
+        delete(Todo)
+        .where(Todo.id == todo_id, Todo.user_id == current_user.id)
+        .returning(Todo.task)
+    )
+    task = db.execute(stmt).scalar_one_or_none()
     
-    if not todo:
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
     
-    # Delete todo
-    db.delete(todo)
     db.commit()
     
     return TodoDeleteResponse(
-        message=f"Todo '{todo.task}' deleted successfully"
+        message=f"Todo '{task}' deleted successfully"
     )
 
 @router.get("/stats/count", response_model=dict)
@@ -238,12 +245,12 @@ def get_todo_stats(
     Returns counts of total, completed, and pending todos.
     """
     
-    # Get counts
-    total = db.query(Todo).filter(Todo.user_id == current_user.id).count()
-    completed = db.query(Todo).filter(
-        Todo.user_id == current_user.id,
-        Todo.completed == True
-    ).count()
+    # Get total and completed counts in a single query
+    row = db.query(
+        func.count(Todo.id),
+        func.sum(case((Todo.completed == True, 1), else_=0))
+    ).filter(Todo.user_id == current_user.id).one()
+    total, completed = row[0], int(row[1] or 0)
     pending = total - completed
     
     return {
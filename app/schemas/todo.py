@@ -1,5 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 class TodoBase(BaseModel):
@@ -10,34 +9,30 @@ class TodoCreate(TodoBase):
     pass
 
 class TodoUpdate(BaseModel):
-    task: Optional[str] = Field(None, min_length=1, description="Updated task description")
-    completed: Optional[bool] = None
+    task: str | None = Field(None, min_length=1, description="Updated task description")
+    completed: bool | None = None
 
 class TodoResponse(TodoBase):
     id: int
     user_id: int
     created_at: datetime
-    updated_at: Optional[datetime] = None
+    updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TodoListResponse(BaseModel):
     todos: list[TodoResponse] = Field(..., description="List of todo items")
     total: int = Field(..., description="Total number of todo items")
 
-    class Config:
-        from_attributes = True  
+    model_config = ConfigDict(from_attributes=True)
 
 class TodoDeleteResponse(BaseModel):
     message: str = Field(..., description="Confirmation message for deletion")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TodoCountResponse(BaseModel):
     count: int = Field(..., description="Total number of todo items")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
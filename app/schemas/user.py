@@ -1,66 +1,102 @@
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional
-from datetime import datetime
-import re
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, field_validator
+from typing import Annotated
+from datetime import datetime, timezone
+import string
 
+# Password complexity character classes, checked with set operations instead of regex
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGIT = frozenset(string.digits)
+_ERR_UPPER = 'Password must contain at least one uppercase letter'
+_ERR_DIGIT = 'Password must contain at least one number'
+
+def _check_password_complexity(v: str) -> str:
+    # Collect the distinct characters in one pass, then test both classes against them
+    chars = set(v)
+    if _UPPER.isdisjoint(chars):
+        raise ValueError(_ERR_UPPER)
+    if _DIGIT.isdisjoint(chars):
+        raise ValueError(_ERR_DIGIT)
+    return v
+
+# Complete password rule as one type: length is enforced by pydantic-core, then the
+# character-class check runs once. A single look-ahead pattern is not an option because
+# pydantic-core's Rust regex engine rejects look-around.
+PasswordStr = Annotated[str, StringConstraints(min_length=8), AfterValidator(_check_password_complexity)]
+
+# Basic address shape check, run entirely by pydantic-core's regex engine
+_EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+Email = Annotated[str, StringConstraints(max_length=254, pattern=_EMAIL_PATTERN)]
+
+# Optional non-empty name for partial updates, built once
+_NAME_FIELD = Field(default=None, min_length=1)
 
 class UserBase(BaseModel):
-    full_name: str = Field(..., min_length=1, description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    full_name: str = Field(..., min_length=1)
+    email: Email
 
 class UserCreate(UserBase):
-    password: str = Field(
-        ..., 
-        min_length=8, 
-        description="Password (minimum 8 characters)"
-    )
-    
-    @validator('password')
-    def validate_password_complexity(cls, v):
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Password must contain at least one number')
-        return v
+    password: PasswordStr
 
 class UserUpdate(BaseModel):
-    full_name: Optional[str] = Field(None, min_length=1)
-    email: Optional[EmailStr] = None
+    full_name: str | None = _NAME_FIELD
+    email: Email | None = None
 
 class UserResponse(UserBase):
     id: int
     is_active: bool
-    created_at: datetime
-    updated_at: Optional[datetime] = None
+    created_at: int = Field(..., description="Creation time as unix timestamp (seconds)")
+    updated_at: int | None = Field(None, description="Last update time as unix timestamp (seconds)")
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid')
+
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
+    def datetime_to_timestamp(cls, v):
+        # Naive values come from databases storing UTC without an offset
+        if isinstance(v, datetime):
+            if v.tzinfo is None:
+                v = v.replace(tzinfo=timezone.utc)
+            return int(v.timestamp())
+        return v
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "UserResponse":
+        """
+        Build a response from a loaded user without running field validation.
+        
+        Only pass objects whose values came straight from the database (ORM
+        users or the cached user snapshot); nothing but the timestamp
+        conversion is applied, so untrusted input must go through model_validate.
+        """
+        values = {field: getattr(obj, field) for field in cls.model_fields}
+        values['created_at'] = cls.datetime_to_timestamp(values['created_at'])
+        values['updated_at'] = cls.datetime_to_timestamp(values['updated_at'])
+        return cls.model_construct(**values)
 
 class UserLogin(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
+    model_config = ConfigDict(frozen=True)
+
 class PasswordChange(BaseModel):
-    current_password: str = Field(..., description="Current password")
-    new_password: str = Field(
-        ..., 
-        min_length=8, 
-        description="New password (minimum 8 characters)"
-    )
-    
-    @validator('new_password')
-    def validate_new_password_complexity(cls, v):
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[0-9]', v):
-            raise ValueError('Password must contain at least one number')
-        return v
+    current_password: str
+    new_password: PasswordStr
+
+    model_config = ConfigDict(frozen=True)
 
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_in: int
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
 class TokenData(BaseModel):
-    user_id: Optional[int] = None
-    email: Optional[str] = None
\ No newline at end of file
+    user_id: int | None = None
+    email: str | None = None
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+# Prebuilt adapter for serializing lists of users in a single pydantic-core call
+UserResponseListAdapter = TypeAdapter(list[UserResponse])